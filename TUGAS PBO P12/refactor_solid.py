@@ -30,9 +30,36 @@ class Order:
 
 
 # === KODE BURUK (SEBELUM REFACTOR) ===
+def _process_credit_card(order: Order):
+    """Handler pembayaran kartu kredit untuk OrderManager lama.
+
+    Args:
+        order (Order): Objek pesanan yang akan diproses.
+    """
+    # Logika detail implementasi hardcoded di sini
+    LOGGER.info("Processing Credit Card...")
+
+
+def _process_bank_transfer(order: Order):
+    """Handler pembayaran transfer bank untuk OrderManager lama.
+
+    Args:
+        order (Order): Objek pesanan yang akan diproses.
+    """
+    # Logika detail implementasi hardcoded di sini
+    LOGGER.info("Processing Bank Transfer...")
+
+
 class OrderManager:  # Melanggar SRP, OCP, DIP
     """Kelas yang menangani proses checkout secara monolitik — melanggar SRP, OCP, dan DIP."""
 
+    # Dispatch via dict: satu hash lookup menggantikan rantai if/elif
+    # yang tumbuh linear setiap kali metode pembayaran bertambah.
+    _METHODS = {
+        "credit_card": _process_credit_card,
+        "bank_transfer": _process_bank_transfer,
+    }
+
     def process_checkout(self, order: Order, payment_method: str):
         """Memulai proses checkout untuk pesanan tertentu dengan metode pembayaran spesifik.
 
@@ -43,21 +70,17 @@ class OrderManager:  # Melanggar SRP, OCP, DIP
         Returns:
             bool: True jika checkout berhasil, False jika gagal atau metode tidak valid.
         """
-        LOGGER.info(f"Memulai checkout untuk {order.customer_name}...")
+        LOGGER.info("Memulai checkout untuk %s...", order.customer_name)
 
         # LOGIKA PEMBAYARAN (Pelanggaran OCP/DIP)
-        if payment_method == "credit_card":
-            # Logika detail implementasi hardcoded di sini
-            LOGGER.info("Processing Credit Card...")
-        elif payment_method == "bank_transfer":
-            # Logika detail implementasi hardcoded di sini
-            LOGGER.info("Processing Bank Transfer...")
-        else:
+        handler = self._METHODS.get(payment_method)
+        if handler is None:
             LOGGER.warning("Metode tidak valid.")
             return False
+        handler(order)
 
         # LOGIKA NOTIFIKASI (Pelanggaran SRP)
-        LOGGER.info(f"Mengirim notifikasi ke {order.customer_name}...")
+        LOGGER.info("Mengirim notifikasi ke %s...", order.customer_name)
         order.status = "paid"
         return True
 
@@ -124,7 +147,7 @@ class EmailNotifier(INotificationService):
         Args:
             order (Order): Objek pesanan yang akan dikirimkan notifikasinya.
         """
-        LOGGER.info(f"Notif: Mengirim email konfirmasi ke {order.customer_name}.")
+        LOGGER.info("Notif: Mengirim email konfirmasi ke %s.", order.customer_name)
 
 
 # --- KELAS KOORDINATOR (SRP & DIP) ---
@@ -154,7 +177,7 @@ class CheckoutService:
         Returns:
             bool: True jika checkout sukses, False jika pembayaran gagal.
         """
-        LOGGER.info(f"Memulai checkout untuk {order.customer_name}. Total: {order.total_price}")
+        LOGGER.info("Memulai checkout untuk %s. Total: %s", order.customer_name, order.total_price)
 
         payment_success = self.payment_processor.process(order)  # Delegasi 1
 
@@ -1,6 +1,11 @@
 import logging
+import re
+import sys
+import textwrap
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Final, List, Dict, Any, Optional, Union
 
 # Konfigurasi logging dasar
 logging.basicConfig(
@@ -10,19 +15,197 @@ logging.basicConfig(
 LOGGER = logging.getLogger(__name__)
 
 
+# Pemetaan nama hari ke integer kecil agar kernel cukup membandingkan angka.
+_DAY_ID: Final = {
+    "Senin": 0,
+    "Selasa": 1,
+    "Rabu": 2,
+    "Kamis": 3,
+    "Jumat": 4,
+    "Sabtu": 5,
+    "Minggu": 6,
+}
+
+
+def _find_conflict(day_ids: List[int], starts: List[int], ends: List[int]) -> tuple[int, int]:
+    """Kernel numerik untuk mendeteksi tumpang tindih interval jadwal.
+
+    Bekerja murni pada integer (id hari dan menit) sehingga mudah
+    dikompilasi (mis. numba/mypyc) tanpa mengubah pemanggilnya.
+
+    Args:
+        day_ids: Id hari per mata kuliah (lihat _DAY_ID).
+        starts: Menit mulai per mata kuliah.
+        ends: Menit selesai per mata kuliah.
+
+    Returns:
+        tuple[int, int]: Indeks pasangan yang bentrok, atau (-1, -1) jika tidak ada.
+    """
+    n = len(day_ids)
+    order = sorted(range(n), key=lambda k: (day_ids[k], starts[k]))
+    prev_day = -1
+    max_end = -1
+    max_end_idx = -1
+    for k in order:
+        if day_ids[k] != prev_day:
+            prev_day = day_ids[k]
+            max_end = -1
+            max_end_idx = -1
+        if starts[k] < max_end:
+            return max_end_idx, k
+        if ends[k] > max_end:
+            max_end = ends[k]
+            max_end_idx = k
+    return -1, -1
+
+
+# Pola jadwal "Hari JamMulai-JamSelesai"; dikompilasi sekali di level modul.
+_SCHED_RE: Final = re.compile(r"(\w+)\s+(\d{2}):(\d{2})-(\d{2}):(\d{2})")
+
+
+def _parse_schedule(sched: str) -> tuple[str, int, int] | None:
+    """Mengurai string jadwal menjadi (hari, menit_mulai, menit_selesai).
+
+    Format jadwal diharapkan: "Hari JamMulai-JamSelesai", contoh: "Senin 08:00-10:00".
+
+    Args:
+        sched: String jadwal mentah.
+
+    Returns:
+        tuple[str, int, int] | None: Hasil parse, atau None jika format tidak valid.
+    """
+    match = _SCHED_RE.fullmatch(sched)
+    if match is None:
+        return None
+    day, start_h, start_m, end_h, end_m = match.groups()
+    return day, int(start_h) * 60 + int(start_m), int(end_h) * 60 + int(end_m)
+
+
+# Model data: dataclass ber-__slots__ agar akses field murah dan hemat memori
+@dataclass(slots=True)
+class Course:
+    """Representasi satu mata kuliah yang diambil mahasiswa.
+
+    Attributes:
+        code: Kode mata kuliah.
+        sks: Bobot SKS mata kuliah.
+        prerequisite: Kode mata kuliah prasyarat, jika ada.
+        schedule: String jadwal mentah, contoh: "Senin 08:00-10:00".
+        day: Nama hari hasil parse jadwal (None jika jadwal tidak valid).
+        day_id: Id hari menurut _DAY_ID (-1 jika tidak valid/tidak dikenal),
+            agar perbandingan hari cukup membandingkan integer.
+        start_min: Menit mulai hasil parse jadwal (-1 jika tidak valid).
+        end_min: Menit selesai hasil parse jadwal (-1 jika tidak valid).
+    """
+    code: str
+    sks: int = 0
+    prerequisite: Optional[str] = None
+    schedule: Optional[str] = None
+    day: Optional[str] = None
+    day_id: int = -1
+    start_min: int = -1
+    end_min: int = -1
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Course":
+        """Membangun Course dari dictionary mentah, sekaligus mem-parse jadwal.
+
+        Args:
+            data: Dictionary mata kuliah, mis. {"code": ..., "sks": ..., "schedule": ...}.
+
+        Returns:
+            Course: Objek mata kuliah dengan jadwal yang sudah diparse.
+        """
+        course = cls(
+            code=data.get("code", ""),
+            sks=data.get("sks", 0),
+            prerequisite=data.get("prerequisite"),
+            schedule=data.get("schedule"),
+        )
+        parsed = _parse_schedule(course.schedule or "")
+        if parsed is not None:
+            day, course.start_min, course.end_min = parsed
+            # Intern nama hari agar perbandingan string sisa memakai
+            # jalur cepat identitas CPython; id integer untuk kernel.
+            course.day = sys.intern(day)
+            course.day_id = _DAY_ID.get(day, -1)
+        return course
+
+
+@dataclass(slots=True)
+class Student:
+    """Representasi data pendaftaran satu mahasiswa (hasil normalisasi).
+
+    Attributes:
+        name: Nama mahasiswa.
+        completed_courses: Himpunan (frozenset) kode mata kuliah yang sudah
+            lulus; dibangun sekali saat normalisasi sehingga bisa dipakai
+            bersama oleh semua aturan dan layak dijadikan kunci cache.
+        courses: Daftar mata kuliah yang diambil.
+        total_sks: Total SKS seluruh mata kuliah yang diambil.
+    """
+    name: str
+    completed_courses: frozenset[str]
+    courses: List[Course]
+    total_sks: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Student":
+        """Membangun Student dari dictionary mentah seperti pada demo.
+
+        Args:
+            data: Data mahasiswa mentah (lihat docstring IValidationRule).
+
+        Returns:
+            Student: Objek mahasiswa yang sudah dinormalisasi.
+        """
+        courses = [Course.from_dict(c) for c in data.get("courses", [])]
+        return cls(
+            name=data.get("name", ""),
+            completed_courses=frozenset(c["code"] for c in data.get("completed_courses", [])),
+            courses=courses,
+            total_sks=sum(c.sks for c in courses),
+        )
+
+
+def _normalize(data: Union[Dict[str, Any], Student]) -> Student:
+    """Menyiapkan data mahasiswa agar aturan tidak perlu mem-parse ulang.
+
+    Dictionary mentah dikonversi sekali menjadi objek Student; objek yang
+    sudah berupa Student diteruskan apa adanya.
+
+    Args:
+        data: Data mahasiswa mentah atau Student yang sudah dinormalisasi.
+
+    Returns:
+        Student: Objek mahasiswa yang sudah dinormalisasi.
+    """
+    if isinstance(data, Student):
+        return data
+    return Student.from_dict(data)
+
+
 # Abstraksi: kontrak untuk semua aturan validasi
 class IValidationRule(ABC):
     """Antarmuka untuk aturan validasi pendaftaran.
 
     Setiap aturan harus mengimplementasikan method `validate`.
+
+    Attributes:
+        COST: Perkiraan biaya relatif aturan. RegistrationService
+            menjalankan aturan dari yang termurah agar aturan mahal bisa
+            dilewati saat aturan murah sudah menolak pendaftaran.
     """
 
+    COST: int = 5
+
     @abstractmethod
-    def validate(self, data: Dict[str, Any]) -> tuple[bool, str]:
+    def validate(self, data: Student) -> Optional[str]:
         """Memvalidasi data mahasiswa berdasarkan aturan spesifik.
 
         Args:
-            data: Data mahasiswa berupa dictionary dengan struktur:
+            data: Objek Student hasil normalisasi. Data mentah berupa
+                dictionary dikonversi lebih dulu lewat `Student.from_dict`:
                 {
                     "name": str,
                     "completed_courses": List[{"code": str}],
@@ -30,17 +213,52 @@ class IValidationRule(ABC):
                 }
 
         Returns:
-            tuple[bool, str]: 
-                - bool: True jika valid, False jika gagal
-                - str: Pesan deskriptif hasil validasi
+            Optional[str]: None jika valid; pesan kegagalan jika tidak.
+                Jalur sukses sengaja tidak membangun objek apa pun.
         """
         pass
 
+    def validate_many(self, batch: List[Student]) -> List[Optional[str]]:
+        """Memvalidasi sekumpulan data mahasiswa sekaligus.
+
+        Implementasi bawaan hanya memanggil `validate` per mahasiswa;
+        subclass boleh meng-override untuk memproses batch secara lebih
+        efisien.
+
+        Args:
+            batch: Daftar data mahasiswa yang sudah dinormalisasi.
+
+        Returns:
+            List[Optional[str]]: Hasil validasi per mahasiswa (None =
+            lolos), searah dengan urutan `batch`.
+        """
+        return [self.validate(data) for data in batch]
+
+    def compile_source(self, ns: Dict[str, Any]) -> Optional[str]:
+        """Meng-emit potongan kode sumber untuk validator terspesialisasi.
+
+        Potongan kode beroperasi pada variabel lokal `student` dan harus
+        `return pesan` saat gagal atau jatuh ke baris berikutnya saat
+        lolos. Konstanta aturan (mis. batas SKS) di-inline sebagai
+        literal; objek pembantu dapat didaftarkan lewat `ns`.
+
+        Args:
+            ns: Namespace global untuk fungsi hasil generate; aturan boleh
+                menambahkan helper yang dirujuk potongan kodenya.
+
+        Returns:
+            Optional[str]: Kode sumber aturan, atau None jika aturan ini
+            tidak mendukung spesialisasi.
+        """
+        return None
+
 
 # Implementasi aturan: Validasi batas SKS
 class SksLimitRule(IValidationRule):
     """Aturan validasi untuk membatasi total SKS yang diambil mahasiswa."""
 
+    COST = 1  # Satu perbandingan integer.
+
     def __init__(self, max_sks: int = 24):
         """Inisialisasi aturan batas SKS.
 
@@ -49,48 +267,105 @@ class SksLimitRule(IValidationRule):
         """
         self.max_sks = max_sks
 
-    def validate(self, data: Dict[str, Any]) -> tuple[bool, str]:
+    def validate(self, data: Student) -> Optional[str]:
         """Memeriksa apakah total SKS melebihi batas.
 
         Args:
             data: Data mahasiswa (lihat docstring IValidationRule).
 
         Returns:
-            tuple[bool, str]: Hasil validasi dan pesan.
+            Optional[str]: None jika valid; pesan kegagalan jika tidak.
         """
-        courses = data.get("courses", [])
-        total_sks = sum(course.get("sks", 0) for course in courses)
-        if total_sks > self.max_sks:
-            return False, f"Total SKS ({total_sks}) melebihi batas maksimal ({self.max_sks})"
-        return True, "SKS valid"
+        if data.total_sks > self.max_sks:
+            return f"Total SKS ({data.total_sks}) melebihi batas maksimal ({self.max_sks})"
+        return None
+
+    def validate_many(self, batch: List[Student]) -> List[Optional[str]]:
+        """Memvalidasi batas SKS untuk satu batch mahasiswa sekaligus.
+
+        Memanfaatkan `total_sks` hasil normalisasi sehingga per mahasiswa
+        hanya tersisa satu perbandingan integer.
+
+        Args:
+            batch: Daftar data mahasiswa yang sudah dinormalisasi.
+
+        Returns:
+            List[Optional[str]]: Hasil validasi per mahasiswa (None = lolos).
+        """
+        max_sks = self.max_sks
+        return [
+            None
+            if data.total_sks <= max_sks
+            else f"Total SKS ({data.total_sks}) melebihi batas maksimal ({max_sks})"
+            for data in batch
+        ]
+
+    def compile_source(self, ns: Dict[str, Any]) -> Optional[str]:
+        """Meng-emit pemeriksaan batas SKS dengan `max_sks` sebagai literal.
+
+        Args:
+            ns: Namespace global untuk fungsi hasil generate (tidak dipakai).
+
+        Returns:
+            Optional[str]: Kode sumber aturan.
+        """
+        template = (
+            'if student.total_sks > {max_sks}:\n'
+            '    return "Total SKS (" + str(student.total_sks) + ")'
+            ' melebihi batas maksimal ({max_sks})"\n'
+        )
+        return template.format(max_sks=self.max_sks)
 
 
 # Implementasi aturan: Validasi prasyarat
 class PrerequisiteRule(IValidationRule):
     """Aturan validasi untuk memastikan prasyarat mata kuliah terpenuhi."""
 
-    def validate(self, data: Dict[str, Any]) -> tuple[bool, str]:
+    COST = 2  # Satu lookup himpunan per mata kuliah.
+
+    def validate(self, data: Student) -> Optional[str]:
         """Memeriksa kelengkapan prasyarat untuk setiap mata kuliah yang diambil.
 
         Args:
             data: Data mahasiswa (lihat docstring IValidationRule).
 
         Returns:
-            tuple[bool, str]: Hasil validasi dan pesan.
+            Optional[str]: None jika valid; pesan kegagalan jika tidak.
         """
-        completed_courses = {c["code"] for c in data.get("completed_courses", [])}
-        for course in data.get("courses", []):
-            prereq = course.get("prerequisite")
+        completed_courses = data.completed_courses
+        courses = data.courses
+        for course in courses:
+            prereq = course.prerequisite
             if prereq and prereq not in completed_courses:
-                return False, f"Prasyarat tidak terpenuhi: {prereq} belum diambil untuk {course['code']}"
-        return True, "Prasyarat terpenuhi"
+                return f"Prasyarat tidak terpenuhi: {prereq} belum diambil untuk {course.code}"
+        return None
+
+    def compile_source(self, ns: Dict[str, Any]) -> Optional[str]:
+        """Meng-emit loop pemeriksaan prasyarat tanpa dispatch method.
+
+        Args:
+            ns: Namespace global untuk fungsi hasil generate (tidak dipakai).
+
+        Returns:
+            Optional[str]: Kode sumber aturan.
+        """
+        return (
+            'completed = student.completed_courses\n'
+            'for course in student.courses:\n'
+            '    prereq = course.prerequisite\n'
+            '    if prereq and prereq not in completed:\n'
+            '        return "Prasyarat tidak terpenuhi: " + prereq'
+            ' + " belum diambil untuk " + course.code\n'
+        )
 
 
 # Implementasi aturan tambahan (untuk challenge OCP)
 class JadwalBentrokRule(IValidationRule):
     """Aturan validasi untuk mendeteksi bentrok jadwal mata kuliah."""
 
-    def validate(self, data: Dict[str, Any]) -> tuple[bool, str]:
+    COST = 10  # Menyusun array lalu sort + sapuan interval.
+
+    def validate(self, data: Student) -> Optional[str]:
         """Memeriksa tumpang tindih jadwal antar mata kuliah.
 
         Format jadwal diharapkan: "Hari JamMulai-JamSelesai", contoh: "Senin 08:00-10:00".
@@ -99,34 +374,71 @@ class JadwalBentrokRule(IValidationRule):
             data: Data mahasiswa (lihat docstring IValidationRule).
 
         Returns:
-            tuple[bool, str]: Hasil validasi dan pesan.
-        """
-        schedules = []
-        for course in data.get("courses", []):
-            sched = course.get("schedule")
-            if sched and " " in sched and "-" in sched:
-                parts = sched.split(" ", 1)
-                day = parts[0]
-                time_part = parts[1]
-                if "-" in time_part:
-                    start, end = time_part.split("-", 1)
-                    schedules.append((day, start.strip(), end.strip(), course["code"]))
-        
-        for i in range(len(schedules)):
-            day1, start1, end1, code1 = schedules[i]
-            for j in range(i + 1, len(schedules)):
-                day2, start2, end2, code2 = schedules[j]
-                if day1 == day2:
-                    try:
-                        s1 = int(start1[:2]) * 60 + int(start1[3:5])
-                        e1 = int(end1[:2]) * 60 + int(end1[3:5])
-                        s2 = int(start2[:2]) * 60 + int(start2[3:5])
-                        e2 = int(end2[:2]) * 60 + int(end2[3:5])
-                        if s1 < e2 and s2 < e1:
-                            return False, f"Jadwal bentrok antara {code1} dan {code2} pada {day1}"
-                    except (ValueError, IndexError):
-                        continue
-        return True, "Tidak ada bentrok jadwal"
+            Optional[str]: None jika valid; pesan kegagalan jika tidak.
+        """
+        # Susun array paralel (id hari, menit mulai, menit selesai) lalu
+        # serahkan deteksi bentroknya ke kernel numerik _find_conflict.
+        codes: List[str] = []
+        days: List[str] = []
+        day_ids: List[int] = []
+        starts: List[int] = []
+        ends: List[int] = []
+        extra_days: Dict[str, int] = {}
+        courses = data.courses
+        for course in courses:
+            day = course.day
+            if day is None:
+                continue
+            day_id = course.day_id
+            if day_id < 0:
+                # Hari di luar _DAY_ID tetap diberi id unik per pemanggilan.
+                day_id = extra_days.setdefault(day, len(_DAY_ID) + len(extra_days))
+            codes.append(course.code)
+            days.append(day)
+            day_ids.append(day_id)
+            starts.append(course.start_min)
+            ends.append(course.end_min)
+
+        i, j = _find_conflict(day_ids, starts, ends)
+        if i >= 0:
+            return f"Jadwal bentrok antara {codes[i]} dan {codes[j]} pada {days[i]}"
+        return None
+
+    def compile_source(self, ns: Dict[str, Any]) -> Optional[str]:
+        """Meng-emit penyusunan array jadwal dan panggilan kernel bentrok.
+
+        Args:
+            ns: Namespace global untuk fungsi hasil generate; kernel
+                `_find_conflict` didaftarkan di sini.
+
+        Returns:
+            Optional[str]: Kode sumber aturan.
+        """
+        ns["_find_conflict"] = _find_conflict
+        template = (
+            'codes = []\n'
+            'day_names = []\n'
+            'day_ids = []\n'
+            'starts = []\n'
+            'ends = []\n'
+            'extra_days = dict()\n'
+            'for course in student.courses:\n'
+            '    if course.day is None:\n'
+            '        continue\n'
+            '    day_id = course.day_id\n'
+            '    if day_id < 0:\n'
+            '        day_id = extra_days.setdefault(course.day, {base} + len(extra_days))\n'
+            '    codes.append(course.code)\n'
+            '    day_names.append(course.day)\n'
+            '    day_ids.append(day_id)\n'
+            '    starts.append(course.start_min)\n'
+            '    ends.append(course.end_min)\n'
+            'i, j = _find_conflict(day_ids, starts, ends)\n'
+            'if i >= 0:\n'
+            '    return "Jadwal bentrok antara " + codes[i]'
+            ' + " dan " + codes[j] + " pada " + day_names[i]\n'
+        )
+        return template.format(base=len(_DAY_ID))
 
 
 # Kelas koordinator: menerapkan SRP dan DIP
@@ -141,12 +453,91 @@ class RegistrationService:
     def __init__(self, rules: List[IValidationRule]):
         """Inisialisasi dengan daftar aturan validasi.
 
+        Aturan diurutkan berdasarkan `COST` agar aturan murah berjalan
+        lebih dulu dan aturan mahal bisa dilewati saat validasi sudah gagal.
+
         Args:
             rules: Daftar objek yang mengimplementasikan IValidationRule.
         """
-        self.rules = rules
+        self.rules = sorted(rules, key=lambda rule: rule.COST)
+        self._compiled = None
+        self._pending: Optional[Student] = None
+        # Cache per-instance agar hasil validasi data identik (pengiriman
+        # ulang dari UI registrasi) tidak dihitung ulang.
+        self._run_rules_cached = lru_cache(maxsize=4096)(self._run_rules)
+
+    @staticmethod
+    def _signature(student: Student) -> tuple:
+        """Membangun kunci cache kanonis dari data yang dibaca aturan.
+
+        Dua mahasiswa dengan signature sama dijamin menghasilkan keputusan
+        validasi yang sama, sehingga aman dijadikan kunci cache.
+
+        Args:
+            student: Objek mahasiswa yang sudah dinormalisasi.
+
+        Returns:
+            tuple: Bentuk hashable dari mata kuliah lulus dan yang diambil.
+        """
+        return (
+            student.completed_courses,
+            tuple(sorted(
+                (c.code, c.sks, c.prerequisite or "", c.schedule or "")
+                for c in student.courses
+            )),
+        )
 
-    def validate_registration(self, student_data: Dict[str, Any]) -> bool:
+    def _run_rules(self, sig: tuple) -> Optional[str]:
+        """Menjalankan seluruh aturan untuk mahasiswa di `self._pending`.
+
+        Hanya dipanggil saat cache miss; `sig` berfungsi sebagai kunci
+        cache dan merepresentasikan seluruh input yang dibaca aturan.
+
+        Args:
+            sig: Signature kanonis dari `_signature`.
+
+        Returns:
+            Optional[str]: None jika seluruh aturan lolos; pesan kegagalan
+            pertama jika tidak.
+        """
+        student = self._pending
+        if self._compiled is not None:
+            return self._compiled(student)
+        for rule in self.rules:
+            message = rule.validate(student)
+            if message is not None:
+                return message
+        return None
+
+    def compile(self) -> bool:
+        """Meng-generate satu fungsi validator terspesialisasi via exec.
+
+        Seluruh logika aturan di-inline ke dalam satu fungsi dengan
+        konstanta aturan (batas SKS, dll.) sebagai literal, sehingga
+        validasi berjalan tanpa dispatch method per aturan. Jika ada
+        aturan yang tidak mendukung spesialisasi, layanan tetap memakai
+        jalur interpretasi biasa.
+
+        Returns:
+            bool: True jika validator terspesialisasi berhasil dibuat.
+        """
+        ns: Dict[str, Any] = {}
+        blocks = []
+        for rule in self.rules:
+            block = rule.compile_source(ns)
+            if block is None:
+                self._compiled = None
+                return False
+            blocks.append(block)
+        src = "def _compiled_validate(student):\n"
+        for block in blocks:
+            src += textwrap.indent(block, "    ")
+        src += '    return None\n'
+        exec(src, ns)
+        self._compiled = ns["_compiled_validate"]
+        return True
+
+    def validate_registration(self, student_data: Union[Dict[str, Any], Student]) -> bool:
         """Menjalankan semua aturan validasi secara berurutan.
 
         Validasi berhenti saat pertama kali gagal.
@@ -157,14 +548,44 @@ class RegistrationService:
         Returns:
             bool: True jika semua aturan lolos, False jika ada yang gagal.
         """
-        for rule in self.rules:
-            is_valid, message = rule.validate(student_data)
-            if not is_valid:
-                LOGGER.warning(f"Validasi gagal: {message}")
-                return False
+        student = _normalize(student_data)
+        self._pending = student
+        try:
+            message = self._run_rules_cached(self._signature(student))
+        finally:
+            self._pending = None
+        if message is not None:
+            LOGGER.warning("Validasi gagal: %s", message)
+            return False
         LOGGER.info("Registrasi berhasil: semua aturan terpenuhi.")
         return True
 
+    def validate_batch(self, students: List[Union[Dict[str, Any], Student]]) -> List[bool]:
+        """Memvalidasi banyak mahasiswa sekaligus, aturan demi aturan.
+
+        Setiap aturan dipanggil sekali untuk seluruh batch (via
+        `validate_many`), dan mahasiswa yang sudah gagal tidak ikut
+        dievaluasi oleh aturan berikutnya.
+
+        Args:
+            students: Daftar data mahasiswa (lihat docstring IValidationRule).
+
+        Returns:
+            List[bool]: Status validasi per mahasiswa, searah dengan `students`.
+        """
+        batch = [_normalize(student) for student in students]
+        results = [True] * len(batch)
+        for rule in self.rules:
+            pending = [i for i, ok in enumerate(results) if ok]
+            if not pending:
+                break
+            outcomes = rule.validate_many([batch[i] for i in pending])
+            for i, message in zip(pending, outcomes):
+                if message is not None:
+                    results[i] = False
+                    LOGGER.warning("Validasi gagal untuk mahasiswa #%d: %s", i, message)
+        return results
+
 
 # Program utama — demo
 if __name__ == "__main__":